@@ -24,6 +24,11 @@ from jobspy.util import (
 )
 from jobspy.ziprecruiter import ZipRecruiter
 
+SITE_DISPLAY_NAMES = {
+    site: "ZipRecruiter" if site == Site.ZIP_RECRUITER else site.value.capitalize()
+    for site in Site
+}
+
 
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
@@ -100,32 +105,29 @@ def scrape_jobs(
         scraper_class = SCRAPER_MAPPING[site]
         scraper = scraper_class(proxies=proxies, ca_cert=ca_cert)
         scraped_data: JobResponse = scraper.scrape(scraper_input)
-        cap_name = site.value.capitalize()
-        site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
-        create_logger(site_name).info(f"finished scraping")
+        create_logger(SITE_DISPLAY_NAMES[site]).info("finished scraping")
         return site.value, scraped_data
 
     site_to_jobs_dict = {}
 
-    def worker(site):
-        site_val, scraped_info = scrape_site(site)
-        return site_val, scraped_info
-
-    with ThreadPoolExecutor() as executor:
+    with ThreadPoolExecutor(max_workers=len(scraper_input.site_type)) as executor:
         future_to_site = {
-            executor.submit(worker, site): site for site in scraper_input.site_type
+            executor.submit(scrape_site, site): site for site in scraper_input.site_type
         }
 
         for future in as_completed(future_to_site):
             site_value, scraped_data = future.result()
             site_to_jobs_dict[site_value] = scraped_data
 
-    jobs_dfs: list[pd.DataFrame] = []
+    job_records: list[dict] = []
+    seen_urls = set()
 
     for site, job_response in site_to_jobs_dict.items():
         for job in job_response.jobs:
+            if job.job_url in seen_urls:
+                continue
+            seen_urls.add(job.job_url)
             job_data = job.dict()
-            job_url = job_data["job_url"]
             job_data["site"] = site
             job_data["company"] = job_data["company_name"]
             job_data["job_type"] = (
@@ -144,20 +146,19 @@ def scrape_jobs(
             # Handle compensation
             compensation_obj = job_data.get("compensation")
             if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
-                )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
+                interval = compensation_obj.get("interval")
+                min_amount = compensation_obj.get("min_amount")
+                max_amount = compensation_obj.get("max_amount")
+                job_data["interval"] = interval.value if interval else None
+                job_data["min_amount"] = min_amount
+                job_data["max_amount"] = max_amount
                 job_data["currency"] = compensation_obj.get("currency", "USD")
                 job_data["salary_source"] = SalarySource.DIRECT_DATA.value
                 if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
+                    interval
+                    and interval.value != "yearly"
+                    and min_amount
+                    and max_amount
                 ):
                     convert_to_annual(job_data)
             else:
@@ -189,15 +190,14 @@ def scrape_jobs(
             job_data["vacancy_count"] = job_data.get("vacancy_count")
             job_data["work_from_home_type"] = job_data.get("work_from_home_type")
 
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
+            job_records.append(job_data)
 
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
+    if job_records:
+        # Step 1: Build a single DataFrame from all records at once
+        jobs_df = pd.DataFrame(job_records)
 
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
+        # Step 2: Filter out all-NA columns
+        jobs_df = jobs_df.dropna(axis=1, how="all")
 
         # Step 3: Ensure all desired columns are present, adding missing ones as empty
         for column in desired_order:
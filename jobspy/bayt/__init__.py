@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import random
 import time
 
@@ -29,14 +30,13 @@ class BaytScraper(Scraper):
     ):
         super().__init__(Site.BAYT, proxies=proxies, ca_cert=ca_cert)
         self.scraper_input = None
-        self.session = None
+        self.session = create_session(
+            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+        )
         self.country = "worldwide"
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
-        )
         job_list: list[JobPost] = []
         page = 1
         results_wanted = (
@@ -49,7 +49,7 @@ class BaytScraper(Scraper):
             if not job_elements:
                 break
 
-            if job_elements:
+            if job_elements and log.isEnabledFor(logging.DEBUG):
                 log.debug(
                     "First job element snippet:\n" + job_elements[0].prettify()[:500]
                 )
@@ -62,7 +62,7 @@ class BaytScraper(Scraper):
                         job_list.append(job_post)
                         if len(job_list) >= results_wanted:
                             break
-                    else:
+                    elif log.isEnabledFor(logging.DEBUG):
                         log.debug(
                             "Extraction returned None. Job snippet:\n"
                             + job.prettify()[:500]
@@ -44,10 +44,13 @@ class Glassdoor(Scraper):
 
         self.base_url = None
         self.country = None
-        self.session = None
+        self.session = create_session(
+            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
+        )
         self.scraper_input = None
         self.jobs_per_page = 30
         self.max_pages = 30
+        self.num_workers = 10
         self.seen_urls = set()
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
@@ -60,9 +63,6 @@ class Glassdoor(Scraper):
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
         self.base_url = self.scraper_input.country.get_glassdoor_url()
 
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
-        )
         token = self._get_csrf_token()
         headers["gd-csrf-token"] = token if token else fallback_token
         self.session.headers.update(headers)
@@ -131,7 +131,7 @@ class Glassdoor(Scraper):
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
 
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
             future_to_job_data = {
                 executor.submit(self._process_job, job): job for job in jobs_data
             }
@@ -163,42 +163,39 @@ class Glassdoor(Scraper):
         """
         Processes a single job and fetches its description.
         """
-        job_id = job_data["jobview"]["job"]["listingId"]
+        job = job_data["jobview"]
+        job_id = job["job"]["listingId"]
         job_url = f"{self.base_url}job-listing/j?jl={job_id}"
         if job_url in self.seen_urls:
             return None
         self.seen_urls.add(job_url)
-        job = job_data["jobview"]
+        header = job["header"]
         title = job["job"]["jobTitleText"]
-        company_name = job["header"]["employerNameFromSearch"]
-        company_id = job_data["jobview"]["header"]["employer"]["id"]
-        location_name = job["header"].get("locationName", "")
-        location_type = job["header"].get("locationType", "")
-        age_in_days = job["header"].get("ageInDays")
+        company_name = header["employerNameFromSearch"]
+        company_id = header["employer"]["id"]
+        location_name = header.get("locationName", "")
+        location_type = header.get("locationType", "")
+        age_in_days = header.get("ageInDays")
         is_remote, location = False, None
-        date_diff = (datetime.now() - timedelta(days=age_in_days)).date()
-        date_posted = date_diff if age_in_days is not None else None
+        date_posted = (
+            (datetime.now() - timedelta(days=age_in_days)).date()
+            if age_in_days is not None
+            else None
+        )
 
         if location_type == "S":
             is_remote = True
         else:
             location = parse_location(location_name)
 
-        compensation = parse_compensation(job["header"])
+        compensation = parse_compensation(header)
         try:
             description = self._fetch_job_description(job_id)
         except:
             description = None
         company_url = f"{self.base_url}Overview/W-EI_IE{company_id}.htm"
-        company_logo = (
-            job_data["jobview"].get("overview", {}).get("squareLogoUrl", None)
-        )
-        listing_type = (
-            job_data["jobview"]
-            .get("header", {})
-            .get("adOrderSponsorshipLevel", "")
-            .lower()
-        )
+        company_logo = job.get("overview", {}).get("squareLogoUrl", None)
+        listing_type = header.get("adOrderSponsorshipLevel", "").lower()
         return JobPost(
             id=f"gd-{job_id}",
             title=title,
@@ -244,7 +241,7 @@ class Glassdoor(Scraper):
                 """,
             }
         ]
-        res = requests.post(url, json=body, headers=headers)
+        res = self.session.post(url, json=body, headers=headers)
         if res.status_code != 200:
             return None
         data = res.json()[0]
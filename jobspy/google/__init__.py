@@ -31,7 +31,9 @@ class Google(Scraper):
         super().__init__(site, proxies=proxies, ca_cert=ca_cert)
 
         self.country = None
-        self.session = None
+        self.session = create_session(
+            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+        )
         self.scraper_input = None
         self.jobs_per_page = 10
         self.seen_urls = set()
@@ -47,9 +49,6 @@ class Google(Scraper):
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
 
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
-        )
         forward_cursor, job_list = self._get_initial_cursor_and_jobs()
         if forward_cursor is None:
             log.warning(
@@ -184,6 +183,7 @@ class Google(Scraper):
             date_posted = (datetime.now() - timedelta(days=days_ago)).date()
 
         description = job_info[19]
+        description_lower = description.lower()
 
         job_post = JobPost(
             id=f"go-{job_info[28]}",
@@ -194,7 +194,7 @@ class Google(Scraper):
             ),
             job_url=job_url,
             date_posted=date_posted,
-            is_remote="remote" in description.lower() or "wfh" in description.lower(),
+            is_remote="remote" in description_lower or "wfh" in description_lower,
             description=description,
             emails=extract_emails_from_text(description),
             job_type=extract_job_type(description),
@@ -126,8 +126,13 @@ class Indeed(Scraper):
         jobs = data["data"]["jobSearch"]["results"]
         new_cursor = data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
 
+        results_needed = (
+            self.scraper_input.results_wanted + self.scraper_input.offset
+        )
         job_list = []
         for job in jobs:
+            if len(self.seen_urls) >= results_needed:
+                break
             processed_job = self._process_job(job["job"])
             if processed_job:
                 job_list.append(processed_job)
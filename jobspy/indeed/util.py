@@ -1,6 +1,8 @@
 from jobspy.model import CompensationInterval, JobType, Compensation
 from jobspy.util import get_enum_from_job_type
 
+remove_separators = str.maketrans("", "", "- ")
+
 
 def get_job_type(attributes: list) -> list[JobType]:
     """
@@ -10,7 +12,7 @@ def get_job_type(attributes: list) -> list[JobType]:
     """
     job_types: list[JobType] = []
     for attribute in attributes:
-        job_type_str = attribute["label"].replace("-", "").replace(" ", "").lower()
+        job_type_str = attribute["label"].translate(remove_separators).lower()
         job_type = get_enum_from_job_type(job_type_str)
         if job_type:
             job_types.append(job_type)
@@ -54,16 +56,17 @@ def is_job_remote(job: dict, description: str) -> bool:
     Searches the description, location, and attributes to check if job is remote
     """
     remote_keywords = ["remote", "work from home", "wfh"]
+    attribute_labels = [attr["label"].lower() for attr in job["attributes"]]
+    description_lower = description.lower()
+    location_lower = job["location"]["formatted"]["long"].lower()
     is_remote_in_attributes = any(
-        any(keyword in attr["label"].lower() for keyword in remote_keywords)
-        for attr in job["attributes"]
+        keyword in label for label in attribute_labels for keyword in remote_keywords
     )
     is_remote_in_description = any(
-        keyword in description.lower() for keyword in remote_keywords
+        keyword in description_lower for keyword in remote_keywords
     )
     is_remote_in_location = any(
-        keyword in job["location"]["formatted"]["long"].lower()
-        for keyword in remote_keywords
+        keyword in location_lower for keyword in remote_keywords
     )
     return is_remote_in_attributes or is_remote_in_description or is_remote_in_location
 
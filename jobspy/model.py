@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Optional
 from datetime import date
 from enum import Enum
@@ -164,6 +165,7 @@ class Country(Enum):
         return f"https://{self.glassdoor_domain_value}/"
 
     @classmethod
+    @lru_cache(maxsize=None)
     def from_string(cls, country_str: str):
         """Convert a string to the corresponding Country enum."""
         country_str = country_str.strip().lower()
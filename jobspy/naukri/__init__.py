@@ -7,7 +7,6 @@ from datetime import datetime, date, timedelta
 from typing import Optional
 
 import regex as re
-import requests
 
 from jobspy.exception import NaukriException
 from jobspy.naukri.constant import headers as naukri_headers
@@ -29,7 +28,6 @@ from jobspy.model import (
 )
 from jobspy.util import (
     extract_emails_from_text,
-    currency_parser,
     markdown_converter,
     create_session,
     create_logger,
@@ -61,7 +59,7 @@ class Naukri(Scraper):
         self.session.headers.update(naukri_headers)
         self.scraper_input = None
         self.country = "India"  #naukri is india-focused by default
-        log.info("Naukri scraper initialized")
+        log.debug("Naukri scraper initialized")
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -106,7 +104,7 @@ class Naukri(Scraper):
 
             params = {k: v for k, v in params.items() if v is not None}
             try:
-                log.debug(f"Sending request to {self.base_url} with params: {params}")
+                log.debug("Sending request to %s with params: %s", self.base_url, params)
                 response = self.session.get(self.base_url, params=params, timeout=10)
                 if response.status_code not in range(200, 400):
                     err = f"Naukri API response status code {response.status_code} - {response.text}"
@@ -127,14 +125,14 @@ class Naukri(Scraper):
                 if not job_id or job_id in seen_ids:
                     continue
                 seen_ids.add(job_id)
-                log.debug(f"Processing job ID: {job_id}")
+                log.debug("Processing job ID: %s", job_id)
 
                 try:
                     fetch_desc = scraper_input.linkedin_fetch_description
                     job_post = self._process_job(job, job_id, fetch_desc)
                     if job_post:
                         job_list.append(job_post)
-                        log.info(f"Added job: {job_post.title} (ID: {job_id})")
+                        log.debug("Added job: %s (ID: %s)", job_post.title, job_id)
                     if not continue_search():
                         break
                 except Exception as e:
@@ -159,8 +157,9 @@ class Naukri(Scraper):
         company = job.get("companyName", "N/A")
         company_url = f"https://www.naukri.com/{job.get('staticUrl', '')}" if job.get("staticUrl") else None
 
-        location = self._get_location(job.get("placeholders", []))
-        compensation = self._get_compensation(job.get("placeholders", []))
+        placeholders = job.get("placeholders", [])
+        location = self._get_location(placeholders)
+        compensation = self._get_compensation(placeholders)
         date_posted = self._parse_date(job.get("footerPlaceholderLabel"), job.get("createdDate"))
 
         job_url = f"https://www.naukri.com{job.get('jdURL', f'/job/{job_id}')}"
@@ -180,7 +179,7 @@ class Naukri(Scraper):
         company_rating = float(ambition_box.get("AggregateRating")) if ambition_box.get("AggregateRating") else None
         company_reviews_count = ambition_box.get("ReviewsCount")
         vacancy_count = job.get("vacancy")
-        work_from_home_type = self._infer_work_from_home_type(job.get("placeholders", []), title, description or "")
+        work_from_home_type = self._infer_work_from_home_type(placeholders, title, description or "")
 
         job_post = JobPost(
             id=f"nk-{job_id}",
@@ -204,7 +203,7 @@ class Naukri(Scraper):
             vacancy_count=vacancy_count,
             work_from_home_type=work_from_home_type,
         )
-        log.debug(f"Processed job: {title} at {company}")
+        log.debug("Processed job: %s at %s", title, company)
         return job_post
 
     def _get_location(self, placeholders: list[dict]) -> Location:
@@ -219,7 +218,6 @@ class Naukri(Scraper):
                 city = parts[0] if parts else None
                 state = parts[1] if len(parts) > 1 else None
                 location = Location(city=city, state=state, country=Country.INDIA)
-                log.debug(f"Parsed location: {location.display_location()}")
                 break
         return location
 
@@ -249,14 +247,14 @@ class Naukri(Scraper):
                         min_salary *= 10000000  # 1 Crore = 10,000,000 INR
                         max_salary *= 10000000
 
-                    log.debug(f"Parsed salary: {min_salary} - {max_salary} INR")
+                    log.debug("Parsed salary: %s - %s INR", min_salary, max_salary)
                     return Compensation(
                         min_amount=int(min_salary),
                         max_amount=int(max_salary),
                         currency=currency,
                     )
                 else:
-                    log.debug(f"Could not parse salary: {salary_text}")
+                    log.debug("Could not parse salary: %s", salary_text)
                     return None
         return None
 
@@ -278,11 +276,11 @@ class Naukri(Scraper):
             if match:
                 days = int(match.group(1))
                 parsed_date = (today - timedelta(days = days)).date()
-                log.debug(f"Date parsed: {days} days ago -> {parsed_date}")
+                log.debug("Date parsed: %s days ago -> %s", days, parsed_date)
                 return parsed_date
         elif created_date:
             parsed_date = datetime.fromtimestamp(created_date / 1000).date()
-            log.debug(f"Date parsed from timestamp: {parsed_date}")
+            log.debug("Date parsed from timestamp: %s", parsed_date)
             return parsed_date
         log.debug("No date parsed")
         return None
@@ -292,10 +290,12 @@ class Naukri(Scraper):
         Infers work-from-home type from job data (e.g., 'Hybrid', 'Remote', 'Work from office')
         """
         location_str = next((p["label"] for p in placeholders if p["type"] == "location"), "").lower()
-        if "hybrid" in location_str or "hybrid" in title.lower() or "hybrid" in description.lower():
+        title_lower = title.lower()
+        description_lower = description.lower()
+        if "hybrid" in location_str or "hybrid" in title_lower or "hybrid" in description_lower:
             return "Hybrid"
-        elif "remote" in location_str or "remote" in title.lower() or "remote" in description.lower():
+        elif "remote" in location_str or "remote" in title_lower or "remote" in description_lower:
             return "Remote"
-        elif "work from office" in description.lower() or not ("remote" in description.lower() or "hybrid" in description.lower()):
+        elif "work from office" in description_lower or not ("remote" in description_lower or "hybrid" in description_lower):
             return "Work from office"
         return None
\ No newline at end of file
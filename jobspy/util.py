@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from itertools import cycle
 
 import numpy as np
@@ -15,6 +16,17 @@ from jobspy.model import CompensationInterval, JobType, Site
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+job_type_keywords = {
+    JobType.FULL_TIME: re.compile(r"full\s?time", re.IGNORECASE),
+    JobType.PART_TIME: re.compile(r"part\s?time", re.IGNORECASE),
+    JobType.INTERNSHIP: re.compile(r"internship", re.IGNORECASE),
+    JobType.CONTRACT: re.compile(r"contract", re.IGNORECASE),
+}
+min_max_regex = re.compile(
+    r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
+)
+
 
 def create_logger(name: str):
     logger = logging.getLogger(f"JobSpy:{name}")
@@ -161,10 +173,10 @@ def markdown_converter(description_html: str):
 def extract_emails_from_text(text: str) -> list[str] | None:
     if not text:
         return None
-    email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
     return email_regex.findall(text)
 
 
+@lru_cache(maxsize=None)
 def get_enum_from_job_type(job_type_str: str) -> JobType | None:
     """
     Given a string, returns the corresponding JobType enum member if a match is found.
@@ -215,7 +227,6 @@ def extract_salary(
         return None, None, None, None
 
     annual_max_salary = None
-    min_max_pattern = r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
 
     def to_int(s):
         return int(float(s.replace(",", "")))
@@ -226,7 +237,7 @@ def extract_salary(
     def convert_monthly_to_annual(monthly_wage):
         return monthly_wage * 12
 
-    match = re.search(min_max_pattern, salary_str)
+    match = min_max_regex.search(salary_str)
 
     if match:
         min_salary = to_int(match.group(1))
@@ -273,16 +284,9 @@ def extract_job_type(description: str):
     if not description:
         return []
 
-    keywords = {
-        JobType.FULL_TIME: r"full\s?time",
-        JobType.PART_TIME: r"part\s?time",
-        JobType.INTERNSHIP: r"internship",
-        JobType.CONTRACT: r"contract",
-    }
-
     listing_types = []
-    for key, pattern in keywords.items():
-        if re.search(pattern, description, re.IGNORECASE):
+    for key, pattern in job_type_keywords.items():
+        if pattern.search(description):
             listing_types.append(key)
 
     return listing_types if listing_types else None
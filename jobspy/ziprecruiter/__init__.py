@@ -52,6 +52,7 @@ class ZipRecruiter(Scraper):
 
         self.delay = 5
         self.jobs_per_page = 20
+        self.num_workers = 10
         self.seen_urls = set()
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
@@ -115,7 +116,7 @@ class ZipRecruiter(Scraper):
         res_data = res.json()
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
             job_results = [executor.submit(self._process_job, job) for job in jobs_list]
 
         job_list = list(filter(None, (result.result() for result in job_results)))
@@ -133,11 +134,6 @@ class ZipRecruiter(Scraper):
 
         description = job.get("job_description", "").strip()
         listing_type = job.get("buyer_type", "")
-        description = (
-            markdown_converter(description)
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN
-            else description
-        )
         company = job.get("hiring_company", {}).get("name")
         country_value = "usa" if job.get("job_country") == "US" else "canada"
         country_enum = Country.from_string(country_value)
@@ -155,6 +151,12 @@ class ZipRecruiter(Scraper):
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
         description_full, job_url_direct = self._get_descr(job_url)
+        if not description_full and description:
+            description = (
+                markdown_converter(description)
+                if self.scraper_input.description_format == DescriptionFormat.MARKDOWN
+                else description
+            )
 
         return JobPost(
             id=f'zr-{job["listing_key"]}',